@@ -1,4 +1,5 @@
 from pymongo import MongoClient
+from flask import g, has_app_context
 
 from dotenv import load_dotenv
 
@@ -6,9 +7,41 @@ import os
 
 load_dotenv(".env")
 
+# One client (and so one connection pool) is shared by every tenant
 conn = MongoClient(os.environ.get("MongoDb_URI"))
 
-students_collection = conn.altSchoolAfricaThirdSemesterExam.students
-courses_collection = conn.altSchoolAfricaThirdSemesterExam.courses
-black_list_collection = conn.altSchoolAfricaThirdSemesterExam.blacklist
-test_collection = conn.altSchoolAfricaThirdSemesterExam.test
+DEFAULT_TENANT = os.environ.get(
+    "default_tenant", "altSchoolAfricaThirdSemesterExam")
+
+# Each tenant (semester/cohort) is served from the database of the same name.
+# Only tenants listed here can be routed to, so a request can't create databases.
+TENANTS = {DEFAULT_TENANT} | {
+    tenant.strip() for tenant in os.environ.get("tenants", "").split(",") if tenant.strip()
+}
+
+
+# This function returns the tenant of the current request, or the default tenant
+def current_tenant():
+    if has_app_context():
+        return g.get("tenant", DEFAULT_TENANT)
+    return DEFAULT_TENANT
+
+
+# This function returns the database of the given tenant, or the current request's tenant
+def get_database(tenant=None):
+    return conn[tenant or current_tenant()]
+
+
+# Collection handle that is resolved against the current request's tenant on every use
+class TenantCollection:
+    def __init__(self, name):
+        self.name = name
+
+    def __getattr__(self, attribute):
+        return getattr(get_database()[self.name], attribute)
+
+
+students_collection = TenantCollection("students")
+courses_collection = TenantCollection("courses")
+black_list_collection = TenantCollection("blacklist")
+test_collection = TenantCollection("test")
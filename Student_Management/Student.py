@@ -1,11 +1,12 @@
 from flask import request
 from flask_restx import Namespace, Resource, fields
 from bson import ObjectId
-from pydantic import BaseModel
+from pydantic import BaseModel, conint
 from typing import Optional, List
 from .Course import course_display_view, Course
 from Database import students_collection, courses_collection, black_list_collection
-from jwt_handeler import hashPassword, check_password, verify_token, decode_token
+from jwt_handeler import hashPassword, check_password
+from .Validation import validate
 
 
 class CourseView(BaseModel):
@@ -18,11 +19,11 @@ class CourseView(BaseModel):
 class StudentModel(BaseModel):
     name: str
     email_address: str
-    courses: List[CourseView]
-    grades: List[int]
+    courses: List[CourseView] = []
+    grades: List[int] = []
     GPA: Optional[float]
     password: str
-    role: str
+    role: str = "student"
 
 
 class StudentUpdateModel(BaseModel):
@@ -30,13 +31,22 @@ class StudentUpdateModel(BaseModel):
     email_address: Optional[str]
 
 
+class ScoreModel(BaseModel):
+    score: conint(strict=True, ge=0, le=100)
+
+
+class LoginModel(BaseModel):
+    email_address: str
+    password: str
+
+
 api = Namespace("students", description="Students related apis")
 
 admin = api.model(
     "Student",
     {
         "name": fields.String(required=True, description="The student's name"),
-        "email_address": fields.String(required=False, description="The student's email address"),
+        "email_address": fields.String(required=True, description="The student's email address"),
         "password": fields.String(required=True)
     }
 )
@@ -45,7 +55,7 @@ student = api.model(
     "Student",
     {
         "name": fields.String(required=True, description="The student's name"),
-        "email_address": fields.String(required=False, description="The student's email address"),
+        "email_address": fields.String(required=True, description="The student's email address"),
         "password": fields.String(required=True)
     }
 )
@@ -62,11 +72,19 @@ student_display_view = api.model(
     }
 )
 
+student_update = api.model(
+    "Student_update",
+    {
+        "name": fields.String(required=False, description="The student's name"),
+        "email_address": fields.String(required=False, description="The student's email address")
+    }
+)
+
 
 score = api.model(
     "Score",
     {
-        "score": fields.Integer()
+        "score": fields.Integer(required=True, min=0, max=100)
     }
 )
 
@@ -107,18 +125,14 @@ class Students(Resource):
     @api.doc("admin_signup")
     @api.expect(admin)
     @api.marshal_with(student_display_view)
-    def post(self):
+    @validate(StudentModel)
+    def post(self, body: StudentModel):
         """Admin Signup"""
 
-        data = request.get_json()
-        name = data.get("name")
-        email_address = data.get("email_address")
-        password = data.get("password")
-
-        student: StudentModel = {}
-        student["name"] = name
-        student["email_address"] = email_address
-        student["password"] = hashPassword(password)
+        student = {}
+        student["name"] = body.name
+        student["email_address"] = body.email_address
+        student["password"] = hashPassword(body.password)
         student["role"] = "admin"
 
         task = students_collection.insert_one(dict(student))
@@ -133,33 +147,20 @@ class CreateStudents(Resource):
     @api.header('token', 'Authorization token')
     @api.expect(student)
     @api.marshal_with(student_display_view)
-    def post(self):
+    @validate(StudentModel, roles=("admin",), denied="Student account can only be created by an admin")
+    def post(self, body: StudentModel):
         """Create student account"""
 
-        token = request.headers.get("token")
-        if token:
-            if verify_token(token):
-                decoded_token = decode_token(token)
-                if (decoded_token["users_role"] == "admin"):
-
-                    data = request.get_json()
-                    name = data.get("name")
-                    email_address = data.get("email_address")
-                    password = data.get("password")
-
-                    student: StudentModel = {}
-                    student["name"] = name
-                    student["email_address"] = email_address
-                    student["password"] = hashPassword(password)
-                    student["role"] = "student"
+        student = {}
+        student["name"] = body.name
+        student["email_address"] = body.email_address
+        student["password"] = hashPassword(body.password)
+        student["role"] = "student"
 
-                    task = students_collection.insert_one(dict(student))
+        task = students_collection.insert_one(dict(student))
 
-                    if task:
-                        return {"response": "Student Sucessfully created"}, 201
-                return {"response": "Student account can only be created by an admin"}
-            return {"response": "Invalid token"}
-        return {"response": "No token provided"}
+        if task:
+            return {"response": "Student Sucessfully created"}, 201
 
 
 @api.route("/<id>")
@@ -169,77 +170,51 @@ class Student(Resource):
     @api.doc("Get a student")
     @api.marshal_with(student_display_view)
     @api.header('token', 'Authorization token')
+    @validate(roles=("admin",), owner="id", denied="Record can only be accessed by either an admin, or the student")
     def get(self, id):
         """Get a student with it's id"""
-        token = request.headers.get("token")
-        if token:
-            if verify_token(token):
-                decoded_token = decode_token(token)
-                if (decoded_token["users_role"] == "admin" or decoded_token["userId"] == id):
-                    student = students_collection.find_one(
-                        {"_id": ObjectId(id)})
-                    if student:
-                        return student
-                    return {"error": "Student not found"}
-                return {"error": "Record can only be accessed by either an admin, or the student"}
-            return {"error": "Invalid token"}
-        return {"error": "No token provided"}
+        student = students_collection.find_one(
+            {"_id": ObjectId(id)})
+        if student:
+            return student
+        return {"error": "Student not found"}
 
     @api.doc("Update a student details")
-    @api.expect(student)
+    @api.expect(student_update)
     @api.marshal_with(student_display_view)
     @api.header('token', 'Authorization token')
-    def put(self, id):
+    @validate(StudentUpdateModel, roles=("admin",), owner="id",
+              denied="Student record can only be updated by the student, or an admin")
+    def put(self, id, body: StudentUpdateModel):
         """Update a student's details, given it's id"""
-        token = request.headers.get("token")
-        if token:
-            if verify_token(token):
-                decoded_token = decode_token(token)
-                if (decoded_token["users_role"] == "admin" or decoded_token["userId"] == id):
-
-                    student = students_collection.find_one(
-                        {"_id": ObjectId(id)})
-
-                    if student:
-
-                        data = request.get_json()
-
-                        new_name = data.get("name")
-
-                        new_email = data.get("email_address")
-
-                        update_details: StudentUpdateModel = {}
-                        if new_name:
-                            update_details["name"] = new_name
-                        if new_email:
-                            update_details["email_address"] = new_email
-
-                        task = students_collection.find_one_and_update(
-                            {"_id": ObjectId(id)}, {"$set": update_details})
-                        if task:
-                            return students_collection.find_one({"_id": ObjectId(id)})
-                        return {"error": "Couldn't update the details"}
-                    return {"error": "Could not find the student record"}
-                return {"error": "Student record can only be updated by the student, or an admin"}
-            return {"error": "Invalid Token"}
-        return {"error": "No token provided"}
+        update_details = {}
+        if body.name:
+            update_details["name"] = body.name
+        if body.email_address:
+            update_details["email_address"] = body.email_address
+        if not update_details:
+            return {"error": "No details to update"}, 400
+
+        student = students_collection.find_one(
+            {"_id": ObjectId(id)})
+
+        if student:
+            task = students_collection.find_one_and_update(
+                {"_id": ObjectId(id)}, {"$set": update_details})
+            if task:
+                return students_collection.find_one({"_id": ObjectId(id)})
+            return {"error": "Couldn't update the details"}
+        return {"error": "Could not find the student record"}
 
     @api.doc("Delete a student record")
     @api.response(204, "Student record deleted")
     @api.header('token', 'Authorization token')
+    @validate(roles=("admin",), denied="Student record can only be deleted by an admin")
     def delete(self, id):
         """Delete a student's record, given it's id"""
-        token = request.headers.get("token")
-        if token:
-            if verify_token(token):
-                decoded_token = decode_token(token)
-                if (decoded_token["users_role"] == "admin"):
-                    students_collection.find_one_and_delete(
-                        {"_id": ObjectId(id)})
-                    return "Deleted"
-                return "Student record can only be deleted by an admin"
-            return "Invalid Token"
-        return {"response": "No token provided"}
+        students_collection.find_one_and_delete(
+            {"_id": ObjectId(id)})
+        return "Deleted"
 
 
 @api.route("/register_course/<course_id>/<student_id>")
@@ -250,42 +225,34 @@ class RegisterCourse(Resource):
     @api.doc("Register a course")
     @api.marshal_with(course_display_view)
     @api.header('token', 'Authorization token')
+    @validate(owner="student_id", denied="Course can only be registered by the student")
     def put(self, student_id, course_id):
         """Register a course to a student"""
-        token = request.headers.get("token")
-        if token:
-            if verify_token(token):
-                decoded_token = decode_token(token)
-                if decoded_token["userId"] == student_id:
-
-                    course = Course.get(Course, course_id)
-                    if course:
-                        student = Student.get(Student, student_id)
-                        if student:
-                            course_to_add: CourseView = {}
-
-                            course_to_add["_id"] = course["_id"]
-                            course_to_add["name"] = course["name"]
-                            course_to_add["teacher"] = course["teacher"]
-                            course_to_add["score"] = 0
-                            course_to_add["course_unit"] = course["course_unit"]
-
-                            students_collection.update_one({"_id": ObjectId(student_id)}, {
-                                "$addToSet": {"courses": course_to_add}})
-
-                            student_for_course: Student = {}
-                            student_for_course["_id"] = student["_id"]
-                            student_for_course["name"] = student["name"]
-                            student_for_course["email_address"] = student["email_address"]
-
-                            courses_collection.update_one({"_id": ObjectId(course_id)}, {
-                                "$addToSet": {"students": student_for_course}})
-                            return course
-                        return {"error": "Student Not found"}
-                    return {"error": "Course not found"}
-                return {"error": "Course can only be registered by the student"}
-            return {"error": "Invalid token"}
-        return {"error": "No token provided"}
+        course = Course.get(Course, id=course_id)
+        if course:
+            student = Student.get(Student, id=student_id)
+            if student:
+                course_to_add = {}
+
+                course_to_add["_id"] = course["_id"]
+                course_to_add["name"] = course["name"]
+                course_to_add["teacher"] = course["teacher"]
+                course_to_add["score"] = 0
+                course_to_add["course_unit"] = course["course_unit"]
+
+                students_collection.update_one({"_id": ObjectId(student_id)}, {
+                    "$addToSet": {"courses": course_to_add}})
+
+                student_for_course = {}
+                student_for_course["_id"] = student["_id"]
+                student_for_course["name"] = student["name"]
+                student_for_course["email_address"] = student["email_address"]
+
+                courses_collection.update_one({"_id": ObjectId(course_id)}, {
+                    "$addToSet": {"students": student_for_course}})
+                return course
+            return {"error": "Student Not found"}
+        return {"error": "Course not found"}
 
 
 @api.route("/record_grade/<course_id>/<student_id>")
@@ -296,55 +263,45 @@ class Grades(Resource):
     @api.expect(score)
     @api.marshal_with(student_display_view)
     @api.header('token', 'Authorization token')
-    def post(self, student_id, course_id):
+    @validate(ScoreModel, roles=("admin",), denied="Grade can only be recorded by a teacher")
+    def post(self, student_id, course_id, body: ScoreModel):
         """Record a score"""
-        token = request.headers.get("token")
-        if token:
-            if verify_token(token):
-                decoded_token = decode_token(token)
-                if (decoded_token["users_role"] == "admin"):
-
-                    data = request.get_json()
-
-                    student = students_collection.find_one(
-                        {"_id": ObjectId(student_id)})
-
-                    if student:
-                        if student["courses"]:
-                            for x in student["courses"]:
-                                if x["_id"] == course_id:
-                                    x["score"] = data["score"]
-                                    students_collection.find_one_and_update(
-                                        {"_id": ObjectId(student_id)}, {"$set": student})
-
-                        course = courses_collection.find_one(
-                            {"_id": ObjectId(course_id)})
-
-                        if course:
-                            if course["students"]:
-                                for x in course["students"]:
-                                    if x["_id"] == student_id:
-                                        x["score"] = data["score"]
-                                courses_collection.find_one_and_update(
-                                    {"_id": ObjectId(course_id)}, {"$set": course})
-
-                        total_score = 0
-                        total_unit = 0
-                        for x in student["courses"]:
-                            score_product = x["score"] * x["course_unit"]
-                            total_unit = total_unit + x["course_unit"]
-                            total_score = total_score + score_product
-
-                        gpa = total_score / total_unit
-                        student["GPA"] = gpa
+        student = students_collection.find_one(
+            {"_id": ObjectId(student_id)})
+
+        if student:
+            if student["courses"]:
+                for x in student["courses"]:
+                    if x["_id"] == course_id:
+                        x["score"] = body.score
                         students_collection.find_one_and_update(
                             {"_id": ObjectId(student_id)}, {"$set": student})
 
-                        return {"response": "Successfully recorded score"}, 200
-                    return "Student Not Found"
-                return {"error": "Grade can only be recorded by a teacher"}
-            return {"error": "Invalid token"}
-        return {"error": "No token provided"}
+            course = courses_collection.find_one(
+                {"_id": ObjectId(course_id)})
+
+            if course:
+                if course["students"]:
+                    for x in course["students"]:
+                        if x["_id"] == student_id:
+                            x["score"] = body.score
+                    courses_collection.find_one_and_update(
+                        {"_id": ObjectId(course_id)}, {"$set": course})
+
+            total_score = 0
+            total_unit = 0
+            for x in student["courses"]:
+                score_product = x["score"] * x["course_unit"]
+                total_unit = total_unit + x["course_unit"]
+                total_score = total_score + score_product
+
+            gpa = total_score / total_unit
+            student["GPA"] = gpa
+            students_collection.find_one_and_update(
+                {"_id": ObjectId(student_id)}, {"$set": student})
+
+            return {"response": "Successfully recorded score"}, 200
+        return "Student Not Found"
 
 
 @api.route("/login")
@@ -352,10 +309,10 @@ class Login(Resource):
     @api.doc("User Login")
     @api.expect(Login_Payload)
     @api.marshal_with(Token)
-    def post(self):
+    @validate(LoginModel)
+    def post(self, body: LoginModel):
         """Login"""
-        data = request.get_json()
-        token = check_password(data)
+        token = check_password(body.dict())
         if token:
             return_value = {"token": token}
             return return_value
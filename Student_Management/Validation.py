@@ -0,0 +1,37 @@
+from flask import g, request
+from functools import wraps
+from pydantic import ValidationError
+from jwt_handeler import verify_token
+
+
+# This decorator validates the request body against a pydantic model and checks the caller's token,
+# before any hashing or database work is done by the handler.
+# The parsed body is passed to the handler as "body".
+# A token is required when roles or owner is given; the caller must then have one of the roles,
+# or be the user whose id is in the owner url parameter
+def validate(model=None, token_required=False, roles=(), owner=None, denied="Access denied"):
+    def decorator(function):
+        @wraps(function)
+        def wrapper(*args, **kwargs):
+            if model:
+                try:
+                    kwargs["body"] = model.parse_obj(
+                        request.get_json(silent=True))
+                except ValidationError as error:
+                    return {"error": str(error)}, 400
+
+            if token_required or roles or owner:
+                token = request.headers.get("token")
+                if not token:
+                    return {"error": "No token provided"}, 401
+                decoded_token = verify_token(token, g.get("token_payload"))
+                if not decoded_token:
+                    return {"error": "Invalid token"}, 401
+                if roles or owner:
+                    is_owner = owner and decoded_token["userId"] == kwargs[owner]
+                    if decoded_token["users_role"] not in roles and not is_owner:
+                        return {"error": denied}, 403
+
+            return function(*args, **kwargs)
+        return wrapper
+    return decorator
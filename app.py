@@ -1,5 +1,6 @@
-from flask import Flask
+from flask import Flask, g, request
 from Student_Management import api
+from jwt_handeler import decode_token, resolve_tenant
 from werkzeug.middleware.proxy_fix import ProxyFix
 
 
@@ -8,6 +9,19 @@ app = Flask('__name__')
 app.wsgi_app = ProxyFix(app.wsgi_app)
 
 
+# Route every request to its tenant's database before it reaches a handler.
+# The token is decoded once here and reused by the handler's auth check
+@app.before_request
+def select_tenant():
+    token = request.headers.get("token")
+    if token:
+        g.token_payload = decode_token(token)
+    tenant = resolve_tenant(request.headers, g.get("token_payload"))
+    if tenant is None:
+        return {"error": "Unknown tenant"}, 400
+    g.tenant = tenant
+
+
 api.init_app(app)
 
 
@@ -1,6 +1,6 @@
 from passlib.context import CryptContext
 from dotenv import load_dotenv
-from Database import students_collection, black_list_collection
+from Database import students_collection, black_list_collection, current_tenant, DEFAULT_TENANT, TENANTS
 from bson import ObjectId
 from datetime import datetime, timedelta
 import jwt
@@ -37,7 +37,8 @@ def sign_jwt(user_id: str):
     payload = {
         "userId": str(user_id),
         "expires": (datetime.now() + timedelta(minutes=30)).strftime("%Y-%m-%d %H:%M:%S.%f"),
-        "users_role": user["role"]
+        "users_role": user["role"],
+        "tenant": current_tenant()
     }
     token = jwt.encode(payload, JWT_SECRET, algorithm=JWT_ALGORITHM)
     return token
@@ -45,7 +46,11 @@ def sign_jwt(user_id: str):
 
 # This function decodes the token and returns the token, if it is not expired
 def decode_token(token):
-    decoded_token = jwt.decode(token, JWT_SECRET, algorithms=[JWT_ALGORITHM])
+    try:
+        decoded_token = jwt.decode(
+            token, JWT_SECRET, algorithms=[JWT_ALGORITHM])
+    except jwt.InvalidTokenError:
+        return False
     if decoded_token:
         expiry_time = datetime.strptime(
             decoded_token['expires'], "%Y-%m-%d %H:%M:%S.%f")
@@ -57,16 +62,25 @@ def decode_token(token):
         return False
 
 
-# This function verifies that a token is valid, by confirming it's not on the blacklist and it is not expired
-def verify_token(token: str):
-    is_token_valid: bool = False
-    check_blacklist = black_list_collection.find_one({"token": token})
-    if check_blacklist:
-        return is_token_valid
-    else:
+# This function verifies that a token is valid, by confirming it's not expired and it is not on the blacklist.
+# It returns the decoded token if it is valid, so callers don't have to decode it again.
+# A payload already decoded from the token can be passed in to skip decoding it
+def verify_token(token: str, payload=None):
+    if payload is None:
         payload = decode_token(token)
-        if payload:
-            is_token_valid = True
-            return is_token_valid
-        else:
-            return is_token_valid
+    if payload:
+        check_blacklist = black_list_collection.find_one({"token": token})
+        if check_blacklist:
+            return False
+        return payload
+    return False
+
+
+# This function picks the tenant of a request, from the decoded token if there is one, else from the tenant header
+def resolve_tenant(headers, payload=None):
+    tenant = headers.get("tenant", DEFAULT_TENANT)
+    if payload:
+        tenant = payload.get("tenant", DEFAULT_TENANT)
+    if tenant in TENANTS:
+        return tenant
+    return None